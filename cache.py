@@ -0,0 +1,60 @@
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+
+# Cached results live next to this file so every run shares them
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+
+def _is_empty(value):
+    """
+    Return True for results that are not worth caching:
+    None, empty containers and empty DataFrames.
+    """
+    if value is None:
+        return True
+    empty = getattr(value, "empty", None)
+    if isinstance(empty, bool):
+        return empty
+    try:
+        return len(value) == 0
+    except TypeError:
+        return False
+
+
+def cached(key, ttl_sec, producer):
+    """
+    Return the cached result for key, or call producer() and cache it.
+    Results are pickled to .cache/ and reused until older than ttl_sec seconds.
+    Example: cached("info:AAPL", 3600, lambda: yf.Ticker("AAPL").info)
+    """
+    path = os.path.join(CACHE_DIR, hashlib.md5(key.encode("utf-8")).hexdigest() + ".pkl")
+
+    # Cache hit: file exists and is still fresh
+    try:
+        if time.time() - os.path.getmtime(path) < ttl_sec:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+    except:
+        pass
+
+    result = producer()
+
+    # Empty results usually mean a failed lookup, so try again next time
+    if _is_empty(result):
+        return result
+
+    # Write to a temp file and rename so concurrent readers never see a partial file
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(result, f)
+        os.replace(tmp_path, path)
+    except:
+        pass
+
+    return result
@@ -1,4 +1,7 @@
 
+import io
+import sys
+
 def fmt_num(x):
     """
     Format a number with comma separators.
@@ -29,4 +32,24 @@ def fmt_large(x):
         else:
             return str(x)
     except:
-        return str(x)
\ No newline at end of file
+        return str(x)
+
+class Printer:
+    """
+    Collect output lines and write them to stdout in one call.
+    Example: with Printer() as out: out.p("Price: 10")
+    Everything is written when the with-block ends.
+    """
+    def __init__(self):
+        self.buf = io.StringIO()
+
+    def p(self, line=""):
+        self.buf.write(f"{line}\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        sys.stdout.write(self.buf.getvalue())
+        sys.stdout.flush()
+        return False
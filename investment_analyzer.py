@@ -4,39 +4,140 @@
 # Teddy Shapiro & Edward Amini
 # December 2025
 
+from __future__ import annotations
+
 import sys
-import yfinance as yf
-import requests
-import matplotlib.pyplot as plt
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import pandas as pd
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING
+import xml.etree.ElementTree as ET
 from helper import fmt_large as fl
 from helper import fmt_num as fn
+from helper import Printer
+from cache import cached
+
+# yfinance, pandas, numpy and matplotlib take about a second to import, so they
+# are imported inside the functions that use them; the Help and Exit menu
+# options then start instantly. These imports are only for type annotations.
+if TYPE_CHECKING:
+    import pandas as pd
+    import yfinance as yf
+
+# Headless mode (INVEST_HEADLESS=1 or HEADLESS=1, or output is not a terminal,
+# e.g. piped or redirected): render charts with the non-interactive Agg backend
+# and save them as PNG files instead of opening windows
+HEADLESS = (bool(os.environ.get('INVEST_HEADLESS') or os.environ.get('HEADLESS'))
+            or not sys.stdout.isatty())
+
+# No-info mode (INVEST_SKIP_INFO=1): skip the yfinance info lookup in Stock
+# Analysis; price metrics then come from fast_info, which derives them from
+# price history, and company name, P/E, EPS and earnings date show as N/A
+SKIP_INFO = bool(os.environ.get('INVEST_SKIP_INFO'))
+
+# Valid ticker symbol: a letter followed by up to 8 letters or '-' (e.g. AAPL, BRK-B).
+# Share classes typed with '.' (BRK.B) are converted first, see _normalize_ticker.
+_TICKER_RE = re.compile(r'^[A-Z][A-Z\-]{0,8}$')
+
+# Symbols that already passed _TICKER_RE, so repeat entries skip the regex (see _is_valid_ticker)
+_VALID_TICKERS = set()
+
+# Process-local yf.Ticker objects, one per symbol (see _ticker)
+_TICKERS = {}
+
+# Projections with at least this many (stock, year) values use the optional numba
+# kernel in projection.py. Importing numba and loading the kernel costs about
+# 0.4-0.5 s per run even with a warm JIT cache (plus ~1.5 s to compile the first
+# time), while NumPy needs only ~14 ms for a million values, so the kernel only
+# pays for itself at roughly 40 million values (e.g. 200,000 stocks x 200 years).
+# No portfolio typed in or imported through this program comes close, so in
+# practice the NumPy path always runs; the kernel is kept for scripted bulk use.
+_NUMBA_MIN_VALUES = 40_000_000
+
+# How long (in seconds) yfinance results stay valid in the on-disk cache
+_INFO_TTL = 3600            # 1 hour
+_HISTORY_TTL = 86400        # 1 day
+
+# Shared HTTP session so repeated news lookups reuse one keep-alive connection
+# (created on first use so startup does not pay for importing requests).
+# yfinance already shares its own browser-impersonating session across all calls.
+_NEWS_SESSION = None
+
+
+_BANNER = "=" * 60
+
+# Help text shown at startup and from menu option 3
+_USAGE = f"""{_BANNER}
+Investment Analyzer - Stock Analysis & Portfolio Projector
+{_BANNER}
+
+This utility provides two main tools:
+
+1. Stock Analysis:
+   - Current price, daily change %, volume, market cap, P/E ratio
+   - Historical performance (1-year, 5-year returns)
+   - Dual visual charts: 1-year and 5-year price history
+   - Recent news headlines via Google News RSS feed
+   - Earnings: Net Income, trailing EPS, next report date
+   - Data sourced from yfinance API (Yahoo Finance)
+
+2. Portfolio Growth Projector:
+   - Enter stock ticker(s), investment amount(s), and holding period
+   - Manual entry OR import from CSV/Excel file
+   - CSV/Excel must have 'TICKER' and 'SHARES' columns
+   - Calculates CAGR from historical data (5-year or max available)
+   - Projects future growth with 2.5% inflation adjustment
+   - Dual charts: Total portfolio + individual stock breakdowns
+
+Usage: python investment_analyzer.py
+       Set INVEST_HEADLESS=1 (or HEADLESS=1) to save charts as PNG files instead of displaying them;
+       this also happens automatically when output is piped or redirected
+       Set INVEST_SKIP_INFO=1 to skip the company info lookup in Stock Analysis
+{_BANNER}
+"""
+
+# Tool menu shown before every choice in main()
+_MENU = f"""
+{_BANNER}
+Select a tool:
+  1 - Stock Analysis
+  2 - Portfolio Growth Projector
+  3 - Help (show instructions)
+  4 - Exit
+{_BANNER}
+"""
 
 
 def usage() -> None:
     '''Print usage message and program description.'''
-    print("=" * 60)
-    print("Investment Analyzer - Stock Analysis & Portfolio Projector")
-    print("=" * 60)
-    print("\nThis utility provides two main tools:")
-    print("\n1. Stock Analysis:")
-    print("   - Current price, daily change %, volume, market cap, P/E ratio")
-    print("   - Historical performance (1-year, 5-year returns)")
-    print("   - Dual visual charts: 1-year and 5-year price history")
-    print("   - Recent news headlines via Google News RSS feed")
-    print("   - Earnings: Net Income, trailing EPS, next report date")
-    print("   - Data sourced from yfinance API (Yahoo Finance)")
-    print("\n2. Portfolio Growth Projector:")
-    print("   - Enter stock ticker(s), investment amount(s), and holding period")
-    print("   - Manual entry OR import from CSV/Excel file")
-    print("   - CSV/Excel must have 'TICKER' and 'SHARES' columns")
-    print("   - Calculates CAGR from historical data (5-year or max available)")
-    print("   - Projects future growth with 2.5% inflation adjustment")
-    print("   - Dual charts: Total portfolio + individual stock breakdowns")
-    print("\nUsage: python investment_analyzer.py")
-    print("=" * 60)
+    sys.stdout.write(_USAGE)
+
+
+def _normalize_ticker(ticker: str) -> str:
+    '''
+    Clean up a typed ticker: strip spaces, uppercase, and write share classes
+    the way Yahoo Finance does ('BRK.B' -> 'BRK-B').
+    
+    Returns:
+        str: The ticker in Yahoo Finance form
+    '''
+    return ticker.strip().upper().replace('.', '-')
+
+
+def _is_valid_ticker(ticker: str) -> bool:
+    '''
+    Check an uppercase symbol against _TICKER_RE, remembering symbols that passed.
+    
+    Returns:
+        bool: True if the ticker is well formed (e.g. AAPL, BRK-B)
+    '''
+    if ticker in _VALID_TICKERS:
+        return True
+    if _TICKER_RE.match(ticker):
+        _VALID_TICKERS.add(ticker)
+        return True
+    return False
 
 
 def get_ticker() -> str:
@@ -47,20 +148,190 @@ def get_ticker() -> str:
         str: A cleaned, uppercase ticker symbol once valid input is provided.
     """
     while True:
-        ticker = input("Please enter the stock ticker you would like to analyze: ").strip()
+        ticker = _normalize_ticker(input("Please enter the stock ticker you would like to analyze: "))
 
         # Check empty input
         if ticker == "":
             print("Error: No ticker entered. Please try again.\n")
             continue
 
-        # Basic validation: must be alphabetic
-        if not ticker.isalpha():
-            print("Error: Ticker symbols must contain only letters. Example: AAPL")
+        # Basic validation: letters, plus '-' for share classes
+        if not _is_valid_ticker(ticker):
+            print("Error: Ticker symbols must contain only letters (or '.'/'-'). Example: AAPL, BRK-B")
             continue
 
         # If valid, return uppercase version
-        return ticker.upper()
+        return ticker
+
+
+def _ticker(symbol: str) -> yf.Ticker:
+    '''
+    Return the shared yf.Ticker object for a symbol, creating it on first use.
+    
+    Returns:
+        yf.Ticker: One object per symbol for the whole program run
+    '''
+    import yfinance as yf
+    ticker_obj = _TICKERS.get(symbol)
+    if ticker_obj is None:
+        ticker_obj = _TICKERS.setdefault(symbol, yf.Ticker(symbol))
+    return ticker_obj
+
+
+def _fetch_quote(ticker: str) -> dict:
+    '''
+    Fetch price metrics from yfinance's fast_info, for use when the info
+    dictionary is skipped. fast_info is not a lighter request: it derives these
+    values from several price-history and share-count downloads.
+    Not cached, since these values change throughout the trading day.
+    
+    Returns:
+        dict: currentPrice, previousClose, volume and marketCap (None when unavailable),
+              keyed like the info dictionary
+    '''
+    import yfinance as yf
+    fast_info = yf.Ticker(ticker).fast_info  # new object: FastInfo keeps the values it first loads
+    # fast_info.get() only accepts camelCase keys
+    keys = {'currentPrice': 'lastPrice', 'previousClose': 'previousClose',
+            'volume': 'lastVolume', 'marketCap': 'marketCap'}
+    quote = {}
+    for info_key, fast_key in keys.items():
+        try:
+            quote[info_key] = fast_info.get(fast_key)
+        except:
+            quote[info_key] = None
+    return quote
+
+
+def _fetch_live_info(ticker: str) -> dict:
+    '''
+    Download a fresh yfinance info dictionary for live quote fields (price, volume).
+    Never cached; a new yf.Ticker is used because each Ticker object keeps the
+    first info it downloads.
+    
+    Returns:
+        dict: Metrics dictionary from Yahoo Finance
+    '''
+    import yfinance as yf
+    return yf.Ticker(ticker).info
+
+
+def _fetch_info(ticker: str, downloaded: dict = None) -> dict:
+    '''
+    Fetch the yfinance info dictionary for a ticker, for slow-changing fields
+    (name, P/E, EPS, earnings date).
+    Cached on disk for _INFO_TTL seconds; failed (empty) lookups are not cached,
+    so they are retried on the next call. On a cache miss, `downloaded` (an info
+    dictionary just fetched by the caller) is stored instead of downloading again.
+    
+    Returns:
+        dict: Metrics dictionary from Yahoo Finance
+    '''
+    if downloaded is not None:
+        return cached(f"info:{ticker}", _INFO_TTL, lambda: downloaded)
+    return cached(f"info:{ticker}", _INFO_TTL, lambda: _ticker(ticker).info)
+
+
+def _fetch_history(ticker: str, period: str) -> pd.DataFrame:
+    '''
+    Fetch a ticker's daily closing prices for a period.
+    Only the Close column is kept (no dividend/split columns), which keeps the
+    frame and its on-disk cache entry small.
+    Cached on disk for _HISTORY_TTL seconds; failed (empty) lookups are not
+    cached, so they are retried on the next call.
+    
+    Returns:
+        DataFrame: Daily 'Close' prices from Yahoo Finance
+    '''
+    def download():
+        history = _ticker(ticker).history(period=period, actions=False)
+        return history[['Close']] if 'Close' in history.columns else history
+    
+    return cached(f"close:{ticker}:{period}", _HISTORY_TTL, download)
+
+
+def _recent_history(history: pd.DataFrame, years: int) -> pd.DataFrame:
+    '''
+    Slice the most recent number of years out of a longer price history.
+    Lets one longer download serve every shorter window.
+    
+    Returns:
+        DataFrame: Rows from the last `years` years (empty if history is empty)
+    '''
+    import pandas as pd
+    if history.empty:
+        return history
+    cutoff = history.index[-1] - pd.DateOffset(years=years)
+    return history.loc[history.index >= cutoff]
+
+
+def _news_session():
+    '''
+    Return the shared HTTP session for news lookups, creating it on first use.
+    Sends a browser User-Agent header so Google accepts our requests.
+    
+    Returns:
+        requests.Session: Session with a pooled keep-alive connection adapter
+    '''
+    global _NEWS_SESSION
+    if _NEWS_SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _NEWS_SESSION = requests.Session()
+        _NEWS_SESSION.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
+        _NEWS_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return _NEWS_SESSION
+
+
+def _read_news_items(response, limit: int = 5) -> list:
+    '''
+    Incrementally parse <item> elements out of a streamed RSS response.
+    Stops parsing once `limit` articles are found, but still reads the rest of
+    the body so the keep-alive connection can go back to the session's pool.
+    
+    Returns:
+        list: Up to `limit` (title, link, date) tuples
+    '''
+    parser = ET.XMLPullParser(events=('end',))
+    items = []
+    for chunk in response.iter_content(chunk_size=8192):
+        if len(items) >= limit:
+            continue  # enough articles; just drain the rest of the body
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            if element.tag == 'item' and len(items) < limit:
+                items.append((element.findtext('title'), element.findtext('link'), element.findtext('pubDate')))
+    return items
+
+
+def _pyplot():
+    '''
+    Import matplotlib.pyplot on first use, selecting the Agg backend in headless mode.
+    
+    Returns:
+        module: matplotlib.pyplot
+    '''
+    import matplotlib
+    if HEADLESS:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _show_or_save(fig, filename: str) -> None:
+    '''
+    Display a finished figure, or save it as a PNG file in headless mode.
+    
+    Returns:
+        None
+    '''
+    plt = _pyplot()
+    if HEADLESS:
+        fig.savefig(filename, dpi=100)
+        plt.close(fig)
+        print(f"[Chart saved to {filename}]")
+    else:
+        plt.show()
 
 
 def stockAnalysis() -> None:
@@ -85,6 +356,9 @@ def stockAnalysis() -> None:
     Returns:
         None
     """
+    import numpy as np
+    import pandas as pd
+
     # Need to --- Implement stock analysis functionality
     # - Prompt user for stock ticker
     # - Fetch current price, daily change %, volume, market cap, P/E ratio
@@ -99,17 +373,22 @@ def stockAnalysis() -> None:
 
     ticker = get_ticker()  # ALWAYS returns a valid ticker now
 
-    stock = yf.Ticker(ticker)
-
     # 2. Fetch data using yfinance
-    ticker_obj = yf.Ticker(ticker)
-    info = ticker_obj.info  # dictionary of metrics
+    ticker_obj = _ticker(ticker)  # shared with the cached info/history lookups
+    if SKIP_INFO:
+        info = {}
+        metrics = _fetch_quote(ticker)
+    else:
+        # Quote fields must be live, so they come from an uncached info download;
+        # the cached info (reused below) only serves name, P/E, EPS and earnings date
+        metrics = _fetch_live_info(ticker)
+        info = _fetch_info(ticker, downloaded=metrics)
 
     # Extract core metrics with safe .get() lookups
-    current_price = info.get("currentPrice")
-    previous_close = info.get("previousClose")
-    volume = info.get("volume")
-    market_cap = info.get("marketCap")
+    current_price = metrics.get("currentPrice")
+    previous_close = metrics.get("previousClose")
+    volume = metrics.get("volume")
+    market_cap = metrics.get("marketCap")
     pe_ratio = info.get("trailingPE")
 
     # Calculate daily % change only if values are present
@@ -117,51 +396,53 @@ def stockAnalysis() -> None:
         daily_change_percent = ((current_price - previous_close) / previous_close) * 100
     else:
         daily_change_percent = None
-    # The output for the User    
-    print("\n--- Current Stock Metrics ---")
-    print(f"Current Price:        {fn(current_price)}")
-    print(f"Previous Close:       {fn(previous_close)}")
-    if daily_change_percent is not None:
-        print(f"Daily Change (%):     {daily_change_percent:.2f}%")
-    else:
-        print("Daily Change (%):     N/A")
-    print(f"Volume:               {fn(volume)}")
-    print(f"Market Cap:           {fl(market_cap)}")
-    print(f"Trailing P/E Ratio:   {fn(pe_ratio)}")
+    # The output for the User (buffered and written as one block)
+    with Printer() as out:
+        out.p("\n--- Current Stock Metrics ---")
+        out.p(f"Current Price:        {fn(current_price)}")
+        out.p(f"Previous Close:       {fn(previous_close)}")
+        if daily_change_percent is not None:
+            out.p(f"Daily Change (%):     {daily_change_percent:.2f}%")
+        else:
+            out.p("Daily Change (%):     N/A")
+        out.p(f"Volume:               {fn(volume)}")
+        out.p(f"Market Cap:           {fl(market_cap)}")
+        out.p(f"Trailing P/E Ratio:   {fn(pe_ratio)}")
     
     # ---------- 3. Historical Performance ----------
 
-    # Download historical price data
-    history_1y = ticker_obj.history(period="1y")
-    history_5y = ticker_obj.history(period="5y")
+    # Download 5 years of daily prices once; the past year is a suffix of it
+    history_5y = _fetch_history(ticker, "5y")
+    history_1y = _recent_history(history_5y, 1)
 
     # 1-year return
     if not history_1y.empty:
-        start_1y = history_1y["Close"].iloc[0]
-        end_1y = history_1y["Close"].iloc[-1]
+        closes_1y = history_1y["Close"].to_numpy(dtype=np.float32)
+        start_1y, end_1y = closes_1y[0], closes_1y[-1]
         return_1y = ((end_1y - start_1y) / start_1y) * 100
     else:
         return_1y = None
 
     # 5-year return
     if not history_5y.empty:
-        start_5y = history_5y["Close"].iloc[0]
-        end_5y = history_5y["Close"].iloc[-1]
+        closes_5y = history_5y["Close"].to_numpy(dtype=np.float32)
+        start_5y, end_5y = closes_5y[0], closes_5y[-1]
         return_5y = ((end_5y - start_5y) / start_5y) * 100
     else:
         return_5y = None
 
     # Display results
-    print("\n--- Historical Performance ---")
-    if return_1y is not None:
-        print(f"1-Year Return:        {return_1y:.2f}%")
-    else:
-        print("1-Year Return:        N/A")
+    with Printer() as out:
+        out.p("\n--- Historical Performance ---")
+        if return_1y is not None:
+            out.p(f"1-Year Return:        {return_1y:.2f}%")
+        else:
+            out.p("1-Year Return:        N/A")
 
-    if return_5y is not None:
-        print(f"5-Year Return:        {return_5y:.2f}%")
-    else:
-        print("5-Year Return:        N/A")
+        if return_5y is not None:
+            out.p(f"5-Year Return:        {return_5y:.2f}%")
+        else:
+            out.p("5-Year Return:        N/A")
     
     # ---------- 4. Recent News ----------
     
@@ -175,41 +456,32 @@ def stockAnalysis() -> None:
         # Build Google News RSS feed URL
         rss_url = f"https://news.google.com/rss/search?q={search_term}+stock&hl=en-US&gl=US&ceid=US:en"
         
-        # Set browser headers so Google accepts our request
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        
-        # Fetch the news feed
-        response = requests.get(rss_url, headers=headers, timeout=10)
-        
-        if response.status_code == 200:
-            # Parse the XML response with BeautifulSoup
-            soup = BeautifulSoup(response.content, 'xml')
-            
-            # Find all news articles
-            articles = soup.find_all('item')
-            
-            # Display up to 5 recent articles
-            if articles:
-                for i, article in enumerate(articles[:5], 1):
-                    title = article.find('title')
-                    link = article.find('link')
-                    date = article.find('pubDate')
-                    
-                    # Print article info if title exists
-                    if title and title.text:
-                        print(f"\n{i}. {title.text}")
-                        if link and link.text:
-                            print(f"   Link: {link.text}")
-                        if date and date.text:
-                            print(f"   Date: {date.text}")
+        # Stream the news feed over the shared session
+        with _news_session().get(rss_url, timeout=10, stream=True) as response:
+            if response.status_code == 200:
+                # Parse only as much of the RSS feed as we need for 5 recent articles
+                articles = _read_news_items(response, limit=5)
+                
+                # Display the articles
+                if articles:
+                    for i, (title, link, date) in enumerate(articles, 1):
+                        # Print article info if title exists
+                        if title:
+                            print(f"\n{i}. {title}")
+                            if link:
+                                print(f"   Link: {link}")
+                            if date:
+                                print(f"   Date: {date}")
+                else:
+                    # No articles found in feed
+                    print("No recent news found.")
+                    print(f"\nView news at: https://finance.yahoo.com/quote/{ticker}/news")
             else:
-                # No articles found in feed
-                print("No recent news found.")
+                # Request failed; read the (small) error body so the connection is reused
+                for _ in response.iter_content(chunk_size=8192):
+                    pass
+                print("Unable to fetch news automatically.")
                 print(f"\nView news at: https://finance.yahoo.com/quote/{ticker}/news")
-        else:
-            # Request failed
-            print("Unable to fetch news automatically.")
-            print(f"\nView news at: https://finance.yahoo.com/quote/{ticker}/news")
             
     except Exception as e:
         # Any error occurred
@@ -227,7 +499,7 @@ def stockAnalysis() -> None:
         if quarterly_income is not None and not quarterly_income.empty:
             # Get the most recent quarter's Net Income
             if 'Net Income' in quarterly_income.index:
-                latest_net_income = quarterly_income.loc['Net Income'].iloc[0]
+                latest_net_income = quarterly_income.loc['Net Income'].to_numpy()[0]
                 quarter_date = quarterly_income.columns[0]
                 
                 print(f"Most Recent Quarter Net Income: ${latest_net_income:,.0f}")
@@ -271,45 +543,59 @@ def stockAnalysis() -> None:
     # ---------- 6. Historical Price Charts (displayed last) ----------
     
     print("\n--- Historical Price Charts ---")
-    print("Close the chart windows to continue...\n")
+    if not HEADLESS:
+        print("Close the chart window to continue...\n")
+    
+    plt = _pyplot()
+    from matplotlib.ticker import StrMethodFormatter
     
-    # Chart 1: 1-year history
+    # Check each chart's data on its own; the charts that have data share one
+    # figure so there is a single window to close
+    charts = []  # (history, title, color, label)
     if not history_1y.empty:
-        plt.figure(figsize=(10, 6))
-        plt.plot(history_1y.index, history_1y['Close'], linewidth=2, color='blue')
-        plt.title(f'{ticker} Stock Price - Past Year', fontsize=14, fontweight='bold')
-        plt.xlabel('Date', fontsize=12)
-        plt.ylabel('Price ($)', fontsize=12)
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        
-        # Format y-axis to show currency
-        ax = plt.gca()
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:.2f}'))
-        
-        plt.show()
-        print("[Chart displayed: 1-year price history]")
+        charts.append((history_1y, 'Past Year', 'blue', '1-year'))
     else:
         print("[1-year chart unavailable: Insufficient price data]")
-    
-    # Chart 2: 5-year history
     if not history_5y.empty:
-        plt.figure(figsize=(10, 6))
-        plt.plot(history_5y.index, history_5y['Close'], linewidth=2, color='green')
-        plt.title(f'{ticker} Stock Price - Past 5 Years', fontsize=14, fontweight='bold')
-        plt.xlabel('Date', fontsize=12)
-        plt.ylabel('Price ($)', fontsize=12)
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        
-        # Format y-axis to show currency
-        ax = plt.gca()
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:.2f}'))
-        
-        plt.show()
-        print("[Chart displayed: 5-year price history]")
+        charts.append((history_5y, 'Past 5 Years', 'green', '5-year'))
     else:
         print("[5-year chart unavailable: Insufficient price data]")
+    
+    if charts:
+        fig, axes = plt.subplots(1, len(charts), figsize=(8 * len(charts), 6), squeeze=False)
+        
+        for ax, (history, title, color, _) in zip(axes[0], charts):
+            ax.plot(history.index, history['Close'], linewidth=2, color=color)
+            ax.set_title(f'{ticker} Stock Price - {title}', fontsize=14, fontweight='bold')
+            ax.set_xlabel('Date', fontsize=12)
+            ax.set_ylabel('Price ($)', fontsize=12)
+            ax.grid(True, alpha=0.3)
+            
+            # Format y-axis to show currency
+            ax.yaxis.set_major_formatter(StrMethodFormatter('${x:.2f}'))
+        
+        plt.tight_layout()
+        _show_or_save(fig, f'{ticker}_price_history.png')
+        if not HEADLESS:
+            print(f"[Charts displayed: {' and '.join(label for *_, label in charts)} price history]")
+
+
+def _ticker_frame(data: pd.DataFrame, ticker: str) -> pd.DataFrame:
+    '''
+    Pull a single ticker's closing prices out of a yf.download() result.
+    Handles both the grouped (multi-ticker) and flat (single-ticker) layouts.
+    
+    Returns:
+        DataFrame: That ticker's 'Close' rows, or an empty DataFrame if it is missing
+    '''
+    import pandas as pd
+    if isinstance(data.columns, pd.MultiIndex):
+        if ticker not in data.columns.get_level_values(0):
+            return pd.DataFrame()
+        data = data[ticker]
+    if 'Close' not in data.columns:
+        return pd.DataFrame()
+    return data[['Close']].dropna()
 
 
 def importPortfolioFromCSV() -> list:
@@ -321,6 +607,9 @@ def importPortfolioFromCSV() -> list:
     Returns:
         list: List of tuples (ticker, dollar_amount) or empty list if import fails
     '''
+    import pandas as pd
+    import yfinance as yf
+    
     # Get file path from user
     file_input = input("\nEnter file path (CSV or Excel, or just filename if in current folder): ").strip()
     
@@ -328,7 +617,6 @@ def importPortfolioFromCSV() -> list:
     file_input = file_input.strip('"').strip("'")
     
     # Check if it's just a filename or full path
-    import os
     if not os.path.isabs(file_input):
         # It's just a filename, look in current directory
         file_path = os.path.join(os.getcwd(), file_input)
@@ -339,10 +627,17 @@ def importPortfolioFromCSV() -> list:
     # Try to read the file (support both CSV and Excel)
     try:
         # Check file extension
+        # Use the faster pyarrow / calamine parsers when installed
         if file_path.lower().endswith('.csv'):
-            df = pd.read_csv(file_path, encoding='utf-8')
+            try:
+                df = pd.read_csv(file_path, encoding='utf-8', engine='pyarrow', dtype_backend='pyarrow')
+            except (ImportError, ValueError):
+                df = pd.read_csv(file_path, encoding='utf-8')
         elif file_path.lower().endswith(('.xlsx', '.xls')):
-            df = pd.read_excel(file_path)
+            try:
+                df = pd.read_excel(file_path, engine='calamine')
+            except (ImportError, ValueError):
+                df = pd.read_excel(file_path)
         else:
             print("Error: File must be .csv, .xlsx, or .xls format")
             return []
@@ -369,51 +664,57 @@ def importPortfolioFromCSV() -> list:
         print(f"Available columns: {list(df.columns)}")
         return []
     
-    # Extract ticker and shares data
-    portfolio = []
+    # Extract ticker and shares data (column-wise, not row by row)
     print("\nProcessing CSV data...")
     
-    for index, row in df.iterrows():
-        ticker = str(row['TICKER']).strip().upper()
-        shares = row['SHARES']
-        
-        # Skip empty rows
-        if pd.isna(ticker) or ticker == '' or ticker == 'NAN':
-            continue
-        if pd.isna(shares) or shares == '':
-            continue
-        
-        # Validate ticker (should be letters only)
-        if not ticker.isalpha():
-            print(f"Warning: Skipping invalid ticker '{ticker}' on row {index + 2}")
-            continue
-        
-        # Convert shares to number
-        try:
-            shares = float(shares)
-            if shares <= 0:
-                print(f"Warning: Skipping {ticker} - shares must be greater than 0")
-                continue
-        except (ValueError, TypeError):
-            print(f"Warning: Skipping {ticker} - invalid share quantity '{shares}'")
-            continue
-        
-        # Fetch current price to calculate dollar amount
-        print(f"Fetching current price for {ticker}...")
+    # Skip empty rows
+    df = df.dropna(subset=['TICKER', 'SHARES'])
+    tickers = df['TICKER'].astype(str).str.strip().str.upper().str.replace('.', '-', regex=False)
+    shares = pd.to_numeric(df['SHARES'], errors='coerce').astype('float64')
+    present = (tickers != '') & (tickers != 'NAN') & (df['SHARES'].astype(str).str.strip() != '')
+    
+    # Validate ticker (letters, plus '-' for share classes; 'BRK.B' became 'BRK-B' above)
+    valid_ticker = tickers.str.match(_TICKER_RE.pattern)
+    for index, ticker in tickers[present & ~valid_ticker].items():
+        print(f"Warning: Skipping invalid ticker '{ticker}' on row {index + 2}")
+    
+    # Validate shares (must be a number greater than 0)
+    candidates = present & valid_ticker
+    invalid_shares = candidates & shares.isna()
+    for ticker, raw_shares in zip(tickers[invalid_shares], df['SHARES'][invalid_shares]):
+        print(f"Warning: Skipping {ticker} - invalid share quantity '{raw_shares}'")
+    for ticker in tickers[candidates & (shares <= 0)]:
+        print(f"Warning: Skipping {ticker} - shares must be greater than 0")
+    
+    # List of (ticker, shares) that passed validation
+    keep = candidates & (shares > 0)
+    holdings = list(zip(tickers[keep].tolist(), shares[keep].tolist()))
+    
+    if not holdings:
+        print("\nError: No valid stocks found in CSV.")
+        return []
+    
+    # Fetch the latest close for every holding in one batched request
+    print(f"Fetching current prices for {len(holdings)} stock(s)...")
+    try:
+        prices = yf.download([ticker for ticker, _ in holdings], period="1d",
+                             group_by="ticker", threads=True, actions=False,
+                             progress=False)
+    except Exception as e:
+        print(f"Error fetching current prices: {e}")
+        return []
+    
+    # Convert share quantities to dollar amounts
+    portfolio = []
+    for ticker, shares in holdings:
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            current_price = info.get('currentPrice')
+            closes = _ticker_frame(prices, ticker).get('Close')
             
-            if current_price is None or current_price <= 0:
-                # Try getting from recent history instead
-                history = stock.history(period="1d")
-                if not history.empty:
-                    current_price = history['Close'].iloc[-1]
-                else:
-                    print(f"Warning: Could not fetch price for {ticker}. Skipping.")
-                    continue
+            if closes is None or closes.empty:
+                print(f"Warning: Could not fetch price for {ticker}. Skipping.")
+                continue
             
+            current_price = closes.to_numpy()[-1]
             dollar_amount = shares * current_price
             portfolio.append((ticker, dollar_amount))
             print(f"  Added: {ticker} - {shares} shares @ ${current_price:.2f} = ${dollar_amount:,.2f}")
@@ -430,6 +731,84 @@ def importPortfolioFromCSV() -> list:
     return portfolio
 
 
+def _cagr_window(ticker: str, max_history: pd.DataFrame) -> tuple:
+    '''
+    Pick the closing prices a stock's historical CAGR is calculated from.
+    Runs in a worker thread, so messages are collected in a list instead of
+    printed, keeping each stock's output together.
+    
+    Returns:
+        tuple: (float32 closing prices, or None if the stock was skipped; list of log lines)
+    '''
+    import numpy as np
+    import pandas as pd
+    log = []
+    try:
+        # Get company name for display
+        info = _fetch_info(ticker)
+        company_name = info.get('longName', ticker)
+        log.append(f"\nAnalyzing {company_name} ({ticker})...")
+        
+        # Determine how long company has been public
+        # All available historical data is used to check IPO date
+        if max_history.empty:
+            log.append(f"Warning: No historical data available for {ticker}. Skipping.")
+            return None, log
+        
+        # Calculate years since IPO (first available trading date)
+        first_date = max_history.index[0]
+        # Convert to timezone-naive datetime
+        first_date_naive = pd.to_datetime(first_date).tz_localize(None)
+        years_since_ipo = (datetime.now() - first_date_naive).days / 365.25
+        
+        log.append(f"  Years since IPO: {years_since_ipo:.1f}")
+        
+        # Determine which period to use based on company age
+        if years_since_ipo < 5:
+            # Young company - use all available data
+            history = max_history
+            log.append("  Using all available data (young company)")
+        elif years_since_ipo < 10:
+            # Mid-age company - use recent 3-5 years to avoid early hypergrowth
+            history = _recent_history(max_history, 5)
+            log.append("  Using recent 5 years (excluding early hypergrowth)")
+        else:
+            # Mature company - use recent 5 years
+            history = _recent_history(max_history, 5)
+            log.append("  Using recent 5 years (mature company)")
+        
+        closes = history['Close'].to_numpy(dtype=np.float32)
+        if closes.size < 2:
+            log.append(f"Warning: Insufficient historical data for {ticker}. Skipping.")
+            return None, log
+        return closes, log
+        
+    except Exception as e:
+        log.append(f"Error analyzing {ticker}: {e}")
+        return None, log
+
+
+def _project_matrix(amounts, growth, years_arr):
+    '''
+    Grow each stock's initial amount at its growth rate for every year offset.
+    Very large projections (see _NUMBA_MIN_VALUES) run in the parallel numba
+    kernel when numba is installed; everything else uses NumPy.
+    
+    Returns:
+        ndarray: One row per stock, one column per year (column 0 is the initial amount)
+    '''
+    import numpy as np
+    if amounts.size * years_arr.size >= _NUMBA_MIN_VALUES:
+        try:
+            from projection import project
+            out = np.empty((amounts.size, years_arr.size))
+            project(amounts, growth, years_arr.size - 1, out)
+            return out
+        except ImportError:
+            pass
+    return amounts[:, None] * (1.0 + growth[:, None]) ** years_arr[None, :]
+
+
 def growthProjector() -> None:
     '''
     Project portfolio growth based on historical performance and inflation adjustment.
@@ -438,6 +817,10 @@ def growthProjector() -> None:
     Returns:
         None
     '''
+    import numpy as np
+    import pandas as pd
+    import yfinance as yf
+    
     print("\n--- Portfolio Growth Projector ---")
     
     # Step 1: Ask user how they want to input portfolio
@@ -463,11 +846,11 @@ def growthProjector() -> None:
         # Manual entry
         while True:
             # Get ticker
-            ticker = input("\nEnter stock ticker: ").strip().upper()
+            ticker = _normalize_ticker(input("\nEnter stock ticker: "))
             
-            # Validate ticker is not empty and contains only letters
-            if ticker == "" or not ticker.isalpha():
-                print("Error: Please enter a valid ticker symbol (letters only).")
+            # Validate ticker is not empty and contains only letters (or '.'/'-')
+            if not _is_valid_ticker(ticker):
+                print("Error: Please enter a valid ticker symbol (letters, '.' or '-' only).")
                 continue
             
             # Get investment amount
@@ -518,103 +901,76 @@ def growthProjector() -> None:
     # Step 3: Calculate CAGR for each stock and project growth
     # US 10-year average inflation rate (approximate)
     INFLATION_RATE = 0.025  # 2.5%
+    # Cap CAGR at 15% to prevent unrealistic projections
+    MAX_CAGR = 0.15
     
-    stock_projections = []  # List to store projection data for each stock
+    # Year offsets and inflation discount factors are the same for every stock
+    years_arr = np.arange(holding_period + 1)
+    inflation_factors = (1.0 + INFLATION_RATE) ** years_arr
     
-    for ticker, initial_amount in portfolio:
-        try:
-            # Get historical data for CAGR calculation
-            stock = yf.Ticker(ticker)
-            
-            # Get company info to find IPO date
-            info = stock.info
-            
-            # Get company name for display
-            company_name = info.get('longName', ticker)
-            print(f"\nAnalyzing {company_name} ({ticker})...")
-            
-            # Determine how long company has been public
-            # Get all available historical data to check IPO date
-            max_history = stock.history(period="max")
-            
-            if max_history.empty:
-                print(f"Warning: No historical data available for {ticker}. Skipping.")
-                continue
-            
-            # Calculate years since IPO (first available trading date)
-            first_date = max_history.index[0]
-            # Convert to timezone-naive datetime
-            first_date_naive = pd.to_datetime(first_date).tz_localize(None)
-            years_since_ipo = (datetime.now() - first_date_naive).days / 365.25
-            
-            print(f"  Years since IPO: {years_since_ipo:.1f}")
-            
-            # Determine which period to use based on company age
-            if years_since_ipo < 5:
-                # Young company - use all available data
-                history = max_history
-                print(f"  Using all available data (young company)")
-            elif years_since_ipo < 10:
-                # Mid-age company - use recent 3-5 years to avoid early hypergrowth
-                history = stock.history(period="5y")
-                print(f"  Using recent 5 years (excluding early hypergrowth)")
-            else:
-                # Mature company - use recent 5 years
-                history = stock.history(period="5y")
-                print(f"  Using recent 5 years (mature company)")
-            
-            if history.empty or len(history) < 2:
-                print(f"Warning: Insufficient historical data for {ticker}. Skipping.")
-                continue
-            
-            # Calculate CAGR: ((Ending Value / Beginning Value)^(1/years)) - 1
-            start_price = history['Close'].iloc[0]
-            end_price = history['Close'].iloc[-1]
-            years_of_data = len(history) / 252  # Approximate trading days per year
-            
-            cagr = ((end_price / start_price) ** (1 / years_of_data)) - 1
-            
-            # Cap CAGR at 15% to prevent unrealistic projections
-            MAX_CAGR = 0.15
-            if cagr > MAX_CAGR:
-                print(f"  Calculated CAGR: {cagr*100:.2f}% (capped at {MAX_CAGR*100:.0f}%)")
-                cagr = MAX_CAGR
-            else:
-                print(f"  Historical CAGR ({int(years_of_data)} years): {cagr*100:.2f}%")
-            
-            # Project future values year by year
-            yearly_values = [initial_amount]  # Start with initial investment
-            for year in range(1, holding_period + 1):
-                # Apply CAGR to get nominal value
-                projected_value = initial_amount * ((1 + cagr) ** year)
-                yearly_values.append(projected_value)
-            
-            # Calculate inflation-adjusted final value
-            nominal_final = yearly_values[-1]
-            real_final = nominal_final / ((1 + INFLATION_RATE) ** holding_period)
-            
-            # Check for NaN values (can happen with invalid/problem stocks)
-            if pd.isna(nominal_final) or pd.isna(real_final) or any(pd.isna(v) for v in yearly_values):
-                print(f"  Warning: Unable to calculate valid projections for {ticker}. Skipping.")
-                continue
-            
-            # Store projection data
-            stock_projections.append({
-                'ticker': ticker,
-                'initial': initial_amount,
-                'cagr': cagr,
-                'yearly_values': yearly_values,
-                'nominal_final': nominal_final,
-                'real_final': real_final
-            })
-            
-            print(f"  Initial Investment: ${initial_amount:,.2f}")
-            print(f"  Projected Value (nominal): ${nominal_final:,.2f}")
-            print(f"  Projected Value (inflation-adjusted): ${real_final:,.2f}")
-            
-        except Exception as e:
-            print(f"Error analyzing {ticker}: {e}")
+    # Download the full price history for every stock in one batched request
+    tickers = [ticker for ticker, _ in portfolio]
+    try:
+        prices = yf.download(tickers, period="max", group_by='ticker', threads=True,
+                             auto_adjust=True, actions=False, progress=False)
+    except Exception as e:
+        print(f"Error downloading price history: {e}")
+        prices = pd.DataFrame()
+    
+    # Fetch company info and pick each stock's price window in parallel (network-bound).
+    # Workers return their messages so each stock's output prints together, in order.
+    with ThreadPoolExecutor(max_workers=min(16, len(portfolio))) as executor:
+        futures = [executor.submit(_cagr_window, ticker, _ticker_frame(prices, ticker))
+                   for ticker, _ in portfolio]
+    windows = [future.result() for future in futures]
+    
+    # Stocks with usable price data, as indexes into portfolio
+    usable = [i for i, (closes, _) in enumerate(windows) if closes is not None]
+    usable_closes = [windows[i][0] for i in usable]
+    
+    # Calculate CAGR for every stock at once: ((Ending Value / Beginning Value)^(1/years)) - 1
+    # and project future values for every year (year 0 = initial investment).
+    # Window endpoints are promoted to float64 so dollar values keep full precision.
+    starts = np.array([closes[0] for closes in usable_closes], dtype=np.float64)
+    ends = np.array([closes[-1] for closes in usable_closes], dtype=np.float64)
+    years_of_data = np.array([closes.size for closes in usable_closes]) / 252  # Approximate trading days per year
+    amounts = np.array([portfolio[i][1] for i in usable], dtype=np.float64)
+    
+    cagrs = (ends / starts) ** (1.0 / years_of_data) - 1.0
+    growth = np.minimum(cagrs, MAX_CAGR)
+    # One row per stock, one column per year (column 0 is the initial investment)
+    yearly_matrix = _project_matrix(amounts, growth, years_arr)
+    real_finals = yearly_matrix[:, -1] / inflation_factors[-1]
+    
+    # Check for NaN values (can happen with invalid/problem stocks)
+    valid_rows = ~np.isnan(yearly_matrix).any(axis=1) & ~np.isnan(real_finals)
+    
+    stock_projections = []  # List to store projection data for each stock
+    for row, i in enumerate(usable):
+        ticker, initial_amount = portfolio[i]
+        log = windows[i][1]
+        
+        if cagrs[row] > MAX_CAGR:
+            log.append(f"  Calculated CAGR: {cagrs[row]*100:.2f}% (capped at {MAX_CAGR*100:.0f}%)")
+        else:
+            log.append(f"  Historical CAGR ({int(years_of_data[row])} years): {cagrs[row]*100:.2f}%")
+        
+        if not valid_rows[row]:
+            log.append(f"  Warning: Unable to calculate valid projections for {ticker}. Skipping.")
             continue
+        
+        # Projection data for this stock
+        stock_projections.append({
+            'ticker': ticker,
+            'initial': initial_amount,
+            'cagr': growth[row],
+            'yearly_values': yearly_matrix[row],
+            'nominal_final': yearly_matrix[row, -1],
+            'real_final': real_finals[row]
+        })
+    
+    for _, log in windows:
+        print("\n".join(log))
     
     # Check if we have any valid projections
     if not stock_projections:
@@ -622,13 +978,12 @@ def growthProjector() -> None:
         return
     
     # Step 4: Calculate total portfolio projections
-    print(f"\n{'='*60}")
-    print("PORTFOLIO SUMMARY")
-    print(f"{'='*60}")
+    yearly_matrix = yearly_matrix[valid_rows]
+    total_yearly_values = yearly_matrix.sum(axis=0)
     
-    total_initial = sum(proj['initial'] for proj in stock_projections)
-    total_nominal = sum(proj['nominal_final'] for proj in stock_projections)
-    total_real = sum(proj['real_final'] for proj in stock_projections)
+    total_initial = total_yearly_values[0]
+    total_nominal = total_yearly_values[-1]
+    total_real = total_nominal / inflation_factors[-1]
     
     # Calculate portfolio CAGR (using total portfolio growth)
     portfolio_cagr = ((total_nominal / total_initial) ** (1 / holding_period)) - 1
@@ -636,54 +991,56 @@ def growthProjector() -> None:
     # Calculate average individual stock CAGR
     average_stock_cagr = sum(proj['cagr'] for proj in stock_projections) / len(stock_projections)
     
-    print(f"\nTotal Initial Investment: ${total_initial:,.2f}")
-    print(f"Total Projected Value (nominal): ${total_nominal:,.2f}")
-    print(f"Total Projected Value (inflation-adjusted): ${total_real:,.2f}")
-    print(f"Total Nominal Gain: ${total_nominal - total_initial:,.2f} ({((total_nominal/total_initial - 1)*100):.2f}%)")
-    print(f"Total Real Gain: ${total_real - total_initial:,.2f} ({((total_real/total_initial - 1)*100):.2f}%)")
-    print(f"\nPortfolio CAGR: {portfolio_cagr*100:.2f}%")
-    print(f"Average Stock CAGR: {average_stock_cagr*100:.2f}%")
+    # Per-stock results as one table (CAGR shown as a percentage)
+    summary = pd.DataFrame(stock_projections)[['ticker', 'initial', 'cagr', 'nominal_final', 'real_final']]
+    summary['cagr'] = summary['cagr'] * 100
+    summary.columns = ['Ticker', 'Initial', 'CAGR', 'Projected (nominal)', 'Projected (real)']
+    money = '${:,.2f}'.format
+    
+    with Printer() as out:
+        out.p(f"\n{'='*60}")
+        out.p("PORTFOLIO SUMMARY")
+        out.p(f"{'='*60}")
+        out.p()
+        out.p(summary.to_string(index=False, formatters={'Initial': money, 'CAGR': '{:.2f}%'.format,
+                                                         'Projected (nominal)': money,
+                                                         'Projected (real)': money}))
+        out.p(f"\nTotal Initial Investment: ${total_initial:,.2f}")
+        out.p(f"Total Projected Value (nominal): ${total_nominal:,.2f}")
+        out.p(f"Total Projected Value (inflation-adjusted): ${total_real:,.2f}")
+        out.p(f"Total Nominal Gain: ${total_nominal - total_initial:,.2f} ({((total_nominal/total_initial - 1)*100):.2f}%)")
+        out.p(f"Total Real Gain: ${total_real - total_initial:,.2f} ({((total_real/total_initial - 1)*100):.2f}%)")
+        out.p(f"\nPortfolio CAGR: {portfolio_cagr*100:.2f}%")
+        out.p(f"Average Stock CAGR: {average_stock_cagr*100:.2f}%")
     
     # Step 5: Generate visualizations
     print("\nGenerating charts...")
+    plt = _pyplot()
+    from matplotlib.ticker import StrMethodFormatter
     
     # Chart 1: Total portfolio value over time
-    years = list(range(holding_period + 1))
-    total_yearly_values = [0] * (holding_period + 1)
-    
-    # Sum up all stocks' values for each year
-    for proj in stock_projections:
-        for i, value in enumerate(proj['yearly_values']):
-            total_yearly_values[i] += value
+    years = years_arr  # same year offsets the projections were computed on
     
     # Debug output
     print(f"\nDebug - Total yearly values: {[f'${v:,.0f}' for v in total_yearly_values[:5]]}... to ${total_yearly_values[-1]:,.0f}")
     print(f"Debug - Number of years: {len(years)}, Number of values: {len(total_yearly_values)}")
     
-    plt.figure(figsize=(10, 6))
-    plt.plot(years, total_yearly_values, marker='o', linewidth=2, markersize=6, color='blue', label='Total Portfolio')
-    plt.title(f'Total Portfolio Projected Growth ({holding_period} Years)', fontsize=14, fontweight='bold')
-    plt.xlabel('Year', fontsize=12)
-    plt.ylabel('Portfolio Value ($)', fontsize=12)
-    plt.grid(True, alpha=0.3)
+    # Both charts share one figure so there is a single window to close
+    fig, (ax_total, ax_ind) = plt.subplots(1, 2, figsize=(16, 7))
+    
+    ax_total.plot(years, total_yearly_values, marker='o', linewidth=2, markersize=6, color='blue', label='Total Portfolio')
+    ax_total.set_title(f'Total Portfolio Projected Growth ({holding_period} Years)', fontsize=14, fontweight='bold')
+    ax_total.set_xlabel('Year', fontsize=12)
+    ax_total.set_ylabel('Portfolio Value ($)', fontsize=12)
+    ax_total.grid(True, alpha=0.3)
     
     # Set explicit axis limits for better visualization
-    plt.xlim(-0.5, holding_period + 0.5)
+    ax_total.set_xlim(-0.5, holding_period + 0.5)
     y_min = min(total_yearly_values) * 0.95
     y_max = max(total_yearly_values) * 1.05
-    plt.ylim(y_min, y_max)
-    
-    plt.tight_layout()
-    
-    # Format y-axis to show currency
-    ax = plt.gca()
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-    
-    plt.show()
+    ax_total.set_ylim(y_min, y_max)
     
     # Chart 2: Individual stock projections
-    plt.figure(figsize=(14, 8))
-    
     # Use a colormap with many distinct colors
     import matplotlib.cm as cm
     colors = cm.tab20c(range(len(stock_projections)))  # tab20c has 20 distinct colors
@@ -692,30 +1049,46 @@ def growthProjector() -> None:
     if len(stock_projections) > 20:
         colors = list(cm.tab20c(range(20))) + list(cm.tab20b(range(len(stock_projections) - 20)))
     
-    for idx, proj in enumerate(stock_projections):
-        plt.plot(years, proj['yearly_values'], marker='o', linewidth=2.5, 
-                markersize=4, label=proj['ticker'], color=colors[idx], alpha=0.8)
+    legend_labels = [proj['ticker'] for proj in stock_projections]
     
-    plt.title(f'Individual Stock Projected Growth ({holding_period} Years)', fontsize=14, fontweight='bold')
-    plt.xlabel('Year', fontsize=12)
-    plt.ylabel('Investment Value ($)', fontsize=12)
+    if len(stock_projections) <= 10:
+        # Small portfolios: one plot call draws every stock with per-year markers
+        legend_handles = ax_ind.plot(years, yearly_matrix.T, marker='o', markersize=4, linewidth=2.5, alpha=0.8)
+        for line, color in zip(legend_handles, colors):
+            line.set_color(color)
+    else:
+        # Large portfolios: markers would add one glyph per stock per year, so draw a single
+        # marker-free LineCollection instead of a separate line per stock
+        from matplotlib.collections import LineCollection
+        from matplotlib.lines import Line2D
+        segments = np.stack([np.column_stack([years, yv]) for yv in yearly_matrix])
+        ax_ind.add_collection(LineCollection(segments, colors=colors, linewidths=2.5, alpha=0.8))
+        ax_ind.autoscale()
+        
+        # Collections have no per-line labels, so build the legend entries by hand
+        legend_handles = [Line2D([0], [0], color=color, linewidth=2.5, alpha=0.8) for color in colors]
+    
+    ax_ind.set_title(f'Individual Stock Projected Growth ({holding_period} Years)', fontsize=14, fontweight='bold')
+    ax_ind.set_xlabel('Year', fontsize=12)
+    ax_ind.set_ylabel('Investment Value ($)', fontsize=12)
     
     # Improve legend: place outside plot area if many stocks
     if len(stock_projections) > 10:
-        plt.legend(loc='center left', bbox_to_anchor=(1, 0.5), fontsize=9, ncol=1)
+        ax_ind.legend(legend_handles, legend_labels, loc='center left', bbox_to_anchor=(1, 0.5), fontsize=9, ncol=1)
     else:
-        plt.legend(loc='best', fontsize=10)
+        ax_ind.legend(legend_handles, legend_labels, loc='best', fontsize=10)
     
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
+    ax_ind.grid(True, alpha=0.3)
     
-    # Format y-axis to show currency
-    ax = plt.gca()
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+    # Format y-axes to show currency (StrMethodFormatter keeps no per-axis state, so one instance serves both)
+    money_fmt = StrMethodFormatter('${x:,.0f}')
+    ax_total.yaxis.set_major_formatter(money_fmt)
+    ax_ind.yaxis.set_major_formatter(money_fmt)
     
-    plt.show()
+    plt.tight_layout()
+    _show_or_save(fig, 'portfolio_growth.png')
     
-    print("\nProjection complete! Charts displayed.")
+    print("\nProjection complete! Charts saved." if HEADLESS else "\nProjection complete! Charts displayed.")
 
 
 def main() -> None:
@@ -730,13 +1103,7 @@ def main() -> None:
     
     # Main program loop
     while True:
-        print("\n" + "=" * 60) 
-        print("Select a tool:")
-        print("  1 - Stock Analysis")
-        print("  2 - Portfolio Growth Projector")
-        print("  3 - Help (show instructions)")
-        print("  4 - Exit")
-        print("=" * 60)
+        sys.stdout.write(_MENU)
         
         choice = input("Enter your choice (1-4): ").strip()
         
@@ -0,0 +1,18 @@
+
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)  # cache=True keeps compiled code in __pycache__ so later runs skip the JIT step
+def project(amounts, growth, years, out):
+    """
+    Compound each stock's initial amount at its growth rate for every year.
+    Writes into out (shape: stocks x years + 1); column 0 is the initial amount.
+    Example: project(np.array([100.0]), np.array([0.1]), 2, out) -> out = [[100, 110, 121]]
+    """
+    for k in prange(amounts.shape[0]):
+        value = amounts[k]
+        out[k, 0] = value
+        factor = 1.0 + growth[k]
+        for y in range(1, years + 1):
+            value *= factor
+            out[k, y] = value